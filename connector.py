@@ -1,3 +1,6 @@
+import logging
+import traceback
+
 from connectors.core.connector import Connector
 from connectors.core.connector import get_logger, ConnectorError
 from .operations import operations, _check_health
@@ -8,9 +11,10 @@ logger = get_logger('dshield_dev')
 class DShieldConnector(Connector):
     def execute(self, config, operation, operation_params, **kwargs):
         try:
-            logger.info('DShieldConnector.execute called with operation: {}'.format(operation))
-            logger.info('Config keys: {}'.format(list(config.keys()) if config else 'None'))
-            logger.info('Operation params: {}'.format(operation_params))
+            logger.info('DShieldConnector.execute called with operation: %s', operation)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Config keys: %s', list(config.keys()) if config else 'None')
+            logger.info('Operation params: %s', operation_params)
             
             operation_func = operations.get(operation)
             if not operation_func:
@@ -18,19 +22,18 @@ class DShieldConnector(Connector):
                 logger.error(error_msg)
                 raise ConnectorError(error_msg)
             
-            logger.info('Executing operation: {}'.format(operation))
+            logger.info('Executing operation: %s', operation)
             result = operation_func(config, operation_params)
             logger.info('Operation completed successfully')
             return result
             
         except ConnectorError as e:
-            logger.error('ConnectorError in execute: {}'.format(str(e)))
+            logger.error('ConnectorError in execute: %s', str(e))
             raise
         except Exception as err:
-            logger.error('Unexpected error in execute: {}'.format(str(err)))
-            logger.error('Error type: {}'.format(type(err).__name__))
-            import traceback
-            logger.error('Traceback: {}'.format(traceback.format_exc()))
+            logger.error('Unexpected error in execute: %s', str(err))
+            logger.error('Error type: %s', type(err).__name__)
+            logger.error('Traceback: %s', traceback.format_exc())
             raise ConnectorError('Unexpected error in connector: {}'.format(str(err)))
 
     def check_health(self, config):
@@ -40,6 +43,6 @@ class DShieldConnector(Connector):
             logger.info('Health check completed successfully')
             return result
         except Exception as e:
-            logger.error('Health check failed: {}'.format(str(e)))
+            logger.error('Health check failed: %s', str(e))
             raise ConnectorError('Health check failed: {}'.format(str(e)))
 
@@ -4,16 +4,171 @@ DShield Shared Library
 Common functionality for DShield connector and standalone scripts
 """
 
+import asyncio
+import functools
+import hashlib
+import os
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import ipaddress
 import json
-import re
 import logging
+import threading
+import time
+import traceback
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit
 import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional HTTP/2 support for bulk lookups (requires the httpx[http2] extra)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Only advertise Brotli when the optional decoder is installed, otherwise
+# the server could send a body urllib3 cannot decompress
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Prefer orjson for JSON parse/serialize when available (noticeably faster
+# on large feed payloads); fall back to the stdlib transparently
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    def _dumps_bytes(obj):
+        return json.dumps(obj, indent=2).encode()
 
 # Configure logging
 logger = logging.getLogger('dshield_dev')
 
+# Shared session so keep-alive connections (and the TLS handshake) are reused
+# across operations instead of being re-established on every call
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount('https://', _ADAPTER)
+# http:// server URLs are accepted by the config, so give them the same
+# pooling and retry behaviour
+_SESSION.mount('http://', _ADAPTER)
+
+
+# In-process TTL cache for idempotent GETs. DShield feeds update on an
+# hourly/daily cadence, so repeat playbook calls within the TTL are served
+# from memory instead of hitting the network again.
+_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE = {}
+
+# Well-known API endpoints, built once instead of per call
+_EP_THREATFEEDS = '/threatfeeds/?json'
+_EP_TOPPORTS = '/topports/?json'
+_EP_TOPIPS = '/topips/?json'
+
+# Endpoint prefix -> cache TTL in seconds (0 / missing = never cached)
+_CACHE_TTLS = (
+    ('/threatfeeds/', 3600),
+    ('/topports/', 900),
+    ('/topips/', 900),
+    ('/ip/', 300),
+)
+
+
+# On-disk cache for idempotent GETs, used by the CLI scripts so repeated
+# invocations (separate processes) within the TTL skip the network entirely.
+# Enabled by setting 'cache_ttl' (seconds) in the config.
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dshield_dev')
+
+
+def _disk_cache_path(url):
+    return os.path.join(_DISK_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+
+def _disk_cache_get(url, ttl):
+    """Return the cached payload for a URL, or None if missing/stale/unreadable"""
+    path = _disk_cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _disk_cache_put(url, payload):
+    """Best-effort write of a payload to the on-disk cache"""
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        with open(_disk_cache_path(url), 'w') as cache_file:
+            json.dump(payload, cache_file)
+    except (OSError, TypeError, ValueError):
+        logger.debug('Failed to write disk cache entry for %s', url)
+
+
+# Request exception type -> error_msg key, ordered most-specific first
+# (SSLError subclasses ConnectionError, so it must be checked before it)
+_EXC_MAP = (
+    (requests.exceptions.SSLError, 'ssl_error'),
+    (requests.exceptions.Timeout, 'time_out'),
+    (requests.exceptions.ConnectionError, 'connection_error'),
+)
+
+
+def _cache_ttl_for(endpoint):
+    """Return the cache TTL in seconds for an endpoint, or 0 if uncacheable"""
+    for prefix, ttl in _CACHE_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return 0
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_base_url(raw_url):
+    """Normalize a configured server URL to its canonical '<scheme>://<host>/api' base
+
+    Memoized so the string cleanup runs once per unique configured URL
+    rather than on every client construction.
+    """
+    server_url = raw_url.strip()
+    if not server_url:
+        return ''
+
+    # Default to HTTPS when no scheme is given
+    if '://' not in server_url:
+        server_url = 'https://' + server_url
+
+    # Split once instead of repeated prefix/suffix string passes
+    parts = urlsplit(server_url)
+    path = parts.path.rstrip('/')
+    if not path.endswith('/api'):
+        path += '/api'
+
+    return urlunsplit((parts.scheme, parts.netloc, path, '', ''))
+
 
 class DShieldError(Exception):
     """Custom exception for DShield operations"""
@@ -22,38 +177,35 @@ class DShieldError(Exception):
 
 class DShield:
     """DShield API client with standardized error handling and authentication"""
-    
+
+    # Static headers shared by every instance (FortiSOAR compliant)
+    BASE_HEADERS = {
+        'Content-Type': 'application/json',
+        'User-Agent': 'FortiSOAR-dshield_dev-Connector/1.1.0',
+        'Accept': 'application/json, text/xml, */*',
+        'Accept-Encoding': _ACCEPT_ENCODING
+    }
+
     def __init__(self, config):
-        server_url = config.get('server_url', '').strip()
+        server_url = _normalize_base_url(config.get('server_url', ''))
         if not server_url:
             raise DShieldError('Server URL is required')
-        
-        # Clean up URL and ensure proper format
-        if not server_url.startswith(('http://', 'https://')):
-            server_url = 'https://' + server_url
-        
-        # Remove trailing slashes and add /api if not present
-        server_url = server_url.rstrip('/')
-        if not server_url.endswith('/api'):
-            server_url = server_url + '/api'
-            
+
         self.base_url = server_url
-        
+
         # Get API key from config (optional for public endpoints)
         api_key = config.get('api_key', '').strip()
         
-        # Set up headers with proper FortiSOAR compliance
-        self.headers = {
-            'Content-Type': 'application/json', 
-            'User-Agent': 'FortiSOAR-dshield_dev-Connector/1.1.0',
-            'Accept': 'application/json, text/xml, */*'
-        }
-        
+        # Set up headers from the shared class-level constant
+        self.headers = dict(self.BASE_HEADERS)
+
         # Add API key to headers if provided (FortiSOAR compliant format)
         if api_key:
             self.headers['Authorization'] = 'API_KEY {}'.format(api_key)
         
         self.timeout = config.get('timeout', 30)
+        # Optional on-disk cache TTL in seconds (used by the CLI scripts)
+        self.disk_cache_ttl = config.get('cache_ttl', 0) or 0
         self.error_msg = {
             400: 'Bad/Invalid Request - Check your parameters',
             401: 'Invalid credentials were provided',
@@ -67,19 +219,47 @@ class DShield:
             'connection_error': 'Failed to connect to the server',
             'invalid_response': 'Invalid response received from server'
         }
+        # Pre-format the per-status error strings so the failure path does
+        # a single dict lookup instead of a get plus format
+        self._api_error = {
+            code: 'API Error {}: {}'.format(code, msg)
+            for code, msg in self.error_msg.items() if isinstance(code, int)
+        }
 
-    def make_rest_call(self, endpoint, params=None, headers=None, data=None, method='GET'):
+    def make_rest_call(self, endpoint, params=None, headers=None, data=None, method='GET', no_cache=False):
         """Make REST API call with standardized error handling"""
-        url = '{0}{1}'.format(self.base_url, endpoint)
-        logger.info('Making {} request to: {}'.format(method, url))
-        
-        # Merge headers
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-        
+        url = f'{self.base_url}{endpoint}'
+        logger.info('Making %s request to: %s', method, url)
+
+        # Serve cacheable GETs from the in-process TTL cache
+        cache_key = None
+        cache_ttl = 0
+        if method == 'GET' and not no_cache and params is None:
+            cache_ttl = _cache_ttl_for(endpoint)
+            if cache_ttl:
+                cache_key = url
+                with _CACHE_LOCK:
+                    cached = _RESPONSE_CACHE.get(cache_key)
+                if cached and cached[0] > time.monotonic():
+                    logger.info('Serving %s from cache', endpoint)
+                    return cached[1]
+
+        # Check the on-disk cache (CLI processes don't share memory)
+        use_disk_cache = bool(
+            method == 'GET' and not no_cache and params is None and self.disk_cache_ttl
+        )
+        if use_disk_cache:
+            disk_cached = _disk_cache_get(url, self.disk_cache_ttl)
+            if disk_cached is not None:
+                logger.info('Serving %s from disk cache', endpoint)
+                return disk_cached
+
+        # Callers rarely pass extra headers, so only build a merged dict
+        # when there is actually something to merge
+        request_headers = self.headers if not headers else {**self.headers, **headers}
+
         try:
-            response = requests.request(
+            response = _SESSION.request(
                 method=method,
                 url=url,
                 json=data,
@@ -89,72 +269,177 @@ class DShield:
                 verify=True
             )
             
-            logger.info('Response status: {}'.format(response.status_code))
+            logger.info('Response status: %s', response.status_code)
+            logger.debug('Response content encoding: %s',
+                         response.headers.get('Content-Encoding', 'identity'))
             
             if response.ok:
-                # Check if response has content
-                if not response.text.strip():
+                # HEAD responses carry no body to parse
+                if method == 'HEAD':
+                    return {'ok': True, 'status': response.status_code}
+
+                # Check if response has content (byte check, no decode)
+                if not response.content:
                     logger.warning('Empty response received from server')
                     return {'error': 'Empty response received from server', 'raw_response': ''}
-                
-                # Check content type to determine if it's JSON or XML
-                content_type = response.headers.get('content-type', '').lower()
-                response_text = response.text.strip()
-                
-                # Check if response starts with XML declaration or XML tag
-                if response_text.startswith('<?xml') or response_text.startswith('<'):
+
+                # Sniff the raw bytes for XML so the body is only decoded
+                # to a str when the text is actually needed
+                head = response.content[:16].lstrip()
+                if head.startswith((b'<?xml', b'<')):
                     logger.info('XML response received, returning raw content for XML parsing')
-                    return {'raw_response': response_text, 'content_type': 'xml'}
-                
+                    payload = {'raw_response': response.text.strip(), 'content_type': 'xml'}
+                    if cache_key:
+                        with _CACHE_LOCK:
+                            _RESPONSE_CACHE[cache_key] = (time.monotonic() + cache_ttl, payload)
+                    if use_disk_cache:
+                        _disk_cache_put(url, payload)
+                    return payload
+
                 # Try to parse as JSON only if it doesn't look like XML
                 try:
-                    return response.json()
-                except json.JSONDecodeError as e:
-                    logger.warning('Non-JSON response received: {}'.format(response_text[:200]))
-                    logger.warning('JSON decode error: {}'.format(str(e)))
-                    return {'raw_response': response_text, 'content_type': 'unknown'}
+                    payload = _loads(response.content)
+                    if cache_key:
+                        with _CACHE_LOCK:
+                            _RESPONSE_CACHE[cache_key] = (time.monotonic() + cache_ttl, payload)
+                    if use_disk_cache:
+                        _disk_cache_put(url, payload)
+                    return payload
+                except ValueError as e:
+                    # Decode only a prefix for the log line; the full body is
+                    # decoded once below for the returned payload
+                    logger.warning('Non-JSON response received: %s',
+                                   response.content[:200].decode('utf-8', 'replace'))
+                    logger.warning('JSON decode error: %s', str(e))
+                    return {'raw_response': response.text.strip(), 'content_type': 'unknown'}
             else:
-                error_msg = self.error_msg.get(response.status_code, 'Unknown error occurred')
-                logger.error('API Error {}: {}'.format(response.status_code, error_msg))
-                raise DShieldError('API Error {}: {}'.format(response.status_code, error_msg))
-                
-        except requests.exceptions.Timeout:
-            logger.exception('Request timeout')
-            raise DShieldError(self.error_msg['time_out'])
-        except requests.exceptions.ConnectionError as e:
-            logger.exception('Connection error: {}'.format(e))
-            raise DShieldError(self.error_msg['connection_error'])
-        except requests.exceptions.SSLError as e:
-            logger.exception('SSL error: {}'.format(e))
-            raise DShieldError(self.error_msg['ssl_error'])
+                error_msg = self._api_error.get(
+                    response.status_code,
+                    'API Error {}: Unknown error occurred'.format(response.status_code)
+                )
+                logger.error(error_msg)
+                raise DShieldError(error_msg)
+
+        except DShieldError:
+            raise
         except requests.exceptions.RequestException as e:
-            logger.exception('Request error: {}'.format(e))
+            logger.exception('Request error: %s', e)
+            for exc_type, msg_key in _EXC_MAP:
+                if isinstance(e, exc_type):
+                    raise DShieldError(self.error_msg[msg_key])
             raise DShieldError('Request failed: {}'.format(str(e)))
         except Exception as e:
-            logger.exception('Unexpected error: {}'.format(e))
+            logger.exception('Unexpected error: %s', e)
             raise DShieldError('Unexpected error: {}'.format(str(e)))
 
 
+class DShieldAsync(DShield):
+    """DShield client that multiplexes concurrent requests over HTTP/2
+
+    Optional variant selected with config['use_http2']. Requires the
+    httpx[http2] extra; many lookups share a single multiplexed connection
+    instead of one pooled connection per in-flight request.
+    """
+
+    def __init__(self, config):
+        if httpx is None:
+            raise DShieldError('HTTP/2 support requires the optional httpx[http2] package')
+        super().__init__(config)
+
+    def make_rest_calls(self, endpoints):
+        """Fetch several endpoints concurrently; failures become error dicts"""
+        return asyncio.run(self._fetch_all(endpoints))
+
+    async def _fetch_all(self, endpoints):
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=True,
+            limits=limits,
+            timeout=self.timeout
+        ) as client:
+            results = await asyncio.gather(
+                *[self._fetch(client, endpoint) for endpoint in endpoints],
+                return_exceptions=True
+            )
+        return [
+            {'error': str(result)} if isinstance(result, Exception) else result
+            for result in results
+        ]
+
+    async def _fetch(self, client, endpoint):
+        try:
+            response = await client.get(endpoint)
+        except httpx.HTTPError as e:
+            raise DShieldError('Request failed: {}'.format(str(e)))
+
+        if not response.is_success:
+            error_msg = self.error_msg.get(response.status_code, 'Unknown error occurred')
+            raise DShieldError('API Error {}: {}'.format(response.status_code, error_msg))
+
+        try:
+            return response.json()
+        except ValueError:
+            return {'raw_response': response.text.strip(), 'content_type': 'unknown'}
+
+
+@functools.lru_cache(maxsize=32)
+def _make_client(server_url, api_key, timeout, cache_ttl=0):
+    """Build a DShield client from hashable config primitives (memoized)"""
+    return DShield({
+        'server_url': server_url,
+        'api_key': api_key,
+        'timeout': timeout,
+        'cache_ttl': cache_ttl
+    })
+
+
+def _get_client(config):
+    """Return a cached DShield client for the given config dict"""
+    return _make_client(
+        config.get('server_url', ''),
+        config.get('api_key', ''),
+        config.get('timeout', 30),
+        config.get('cache_ttl', 0) or 0
+    )
+
+
+def _safe_int(value):
+    """Convert a value to int, returning 0 for missing or non-numeric input"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
 def _validate_ip_address(ip):
-    """Validate IP address format using regex"""
-    ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    return re.match(ip_pattern, ip) is not None
+    """Validate IP address format using the stdlib ipaddress parser"""
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
 
 
 def _check_health(config):
     """Check the health of the DShield connector"""
     try:
-        dshield_obj = DShield(config)
-        # Try to access a simple endpoint to verify connectivity
-        endpoint = '/threatfeeds/?json'
-        response = dshield_obj.make_rest_call(endpoint)
+        dshield_obj = _get_client(config)
+        # A HEAD request verifies connectivity without downloading and
+        # parsing the full feed payload on every probe; fall back to GET
+        # in case the server rejects HEAD
+        try:
+            dshield_obj.make_rest_call(_EP_THREATFEEDS, method='HEAD')
+        except DShieldError:
+            dshield_obj.make_rest_call(_EP_THREATFEEDS)
         logger.info('Health check successful')
         return True
     except DShieldError as e:
-        logger.error('Health check failed: {}'.format(str(e)))
+        logger.error('Health check failed: %s', str(e))
         raise DShieldError('Health check failed: {}'.format(str(e)))
     except Exception as e:
-        logger.error('Health check failed with unexpected error: {}'.format(str(e)))
+        logger.error('Health check failed with unexpected error: %s', str(e))
         raise DShieldError('Health check failed: Unable to connect to DShield API')
 
 
@@ -169,11 +454,11 @@ def lookup_ip(config, params):
         raise DShieldError('Invalid IP address format: {}'.format(ip))
     
     try:
-        dshield_obj = DShield(config)
+        dshield_obj = _get_client(config)
         endpoint = '/ip/{}?json'.format(ip)
-        logger.info('Looking up IP: {}'.format(ip))
+        logger.info('Looking up IP: %s', ip)
         
-        result = dshield_obj.make_rest_call(endpoint)
+        result = dshield_obj.make_rest_call(endpoint, no_cache=bool(params.get('no_cache')))
         
         # Add metadata to the response
         if isinstance(result, dict):
@@ -188,18 +473,82 @@ def lookup_ip(config, params):
     except DShieldError:
         raise
     except Exception as e:
-        logger.error('Error in lookup_ip: {}'.format(str(e)))
+        logger.error('Error in lookup_ip: %s', str(e))
         raise DShieldError('Failed to lookup IP: {}'.format(str(e)))
 
 
+def lookup_ips(config, params):
+    """Lookup multiple IP addresses from DShield concurrently"""
+    ips = params.get('ips', [])
+    if isinstance(ips, str):
+        ips = [ip.strip() for ip in ips.split(',') if ip.strip()]
+
+    if not ips:
+        raise DShieldError('At least one IP address is required')
+
+    invalid_ips = [ip for ip in ips if not _validate_ip_address(ip)]
+    if invalid_ips:
+        raise DShieldError('Invalid IP address format: {}'.format(', '.join(invalid_ips)))
+
+    try:
+        no_cache = bool(params.get('no_cache'))
+        logger.info('Looking up %s IPs concurrently', len(ips))
+
+        # Multiplex the batch over one HTTP/2 connection when enabled and
+        # the optional httpx dependency is available
+        if config.get('use_http2') and httpx is not None:
+            dshield_async = DShieldAsync(config)
+            payloads = dshield_async.make_rest_calls(['/ip/{}?json'.format(ip) for ip in ips])
+            return {
+                'results': dict(zip(ips, payloads)),
+                '_metadata': {
+                    'source': 'DShield',
+                    'connector_version': '1.1.0',
+                    'total_ips': len(ips)
+                }
+            }
+
+        dshield_obj = _get_client(config)
+
+        # The shared session is thread-safe, so the lookups can run in
+        # parallel and complete in roughly one round-trip instead of N
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(16, len(ips))) as executor:
+            futures = {
+                executor.submit(dshield_obj.make_rest_call, '/ip/{}?json'.format(ip), no_cache=no_cache): ip
+                for ip in ips
+            }
+            for future in as_completed(futures):
+                ip = futures[future]
+                try:
+                    results[ip] = future.result()
+                except DShieldError as e:
+                    results[ip] = {'error': str(e)}
+
+        return {
+            'results': results,
+            '_metadata': {
+                'source': 'DShield',
+                'connector_version': '1.1.0',
+                'total_ips': len(ips)
+            }
+        }
+
+    except DShieldError:
+        raise
+    except Exception as e:
+        logger.error('Error in lookup_ips: %s', str(e))
+        raise DShieldError('Failed to lookup IPs: {}'.format(str(e)))
+
+
 def get_threat_feeds(config, params):
     """Get available threat feeds from DShield"""
     try:
-        dshield_obj = DShield(config)
-        endpoint = '/threatfeeds/?json'
+        dshield_obj = _get_client(config)
+        endpoint = _EP_THREATFEEDS
         logger.info('Retrieving threat feeds from DShield')
         
-        result = dshield_obj.make_rest_call(endpoint)
+        result = dshield_obj.make_rest_call(endpoint, no_cache=bool(params.get('no_cache')) if params else False)
         
         # Add metadata to the response
         if isinstance(result, list):
@@ -222,18 +571,18 @@ def get_threat_feeds(config, params):
     except DShieldError:
         raise
     except Exception as e:
-        logger.error('Error in get_threat_feeds: {}'.format(str(e)))
+        logger.error('Error in get_threat_feeds: %s', str(e))
         raise DShieldError('Failed to retrieve threat feeds: {}'.format(str(e)))
 
 
 def get_top_ports(config, params):
     """Get top ports information from DShield"""
     try:
-        dshield_obj = DShield(config)
-        endpoint = '/topports/?json'
+        dshield_obj = _get_client(config)
+        endpoint = _EP_TOPPORTS
         logger.info('Retrieving top ports from DShield')
         
-        result = dshield_obj.make_rest_call(endpoint)
+        result = dshield_obj.make_rest_call(endpoint, no_cache=bool(params.get('no_cache')) if params else False)
         
         # Add metadata to the response
         if isinstance(result, dict):
@@ -247,20 +596,25 @@ def get_top_ports(config, params):
     except DShieldError:
         raise
     except Exception as e:
-        logger.error('Error in get_top_ports: {}'.format(str(e)))
+        logger.error('Error in get_top_ports: %s', str(e))
         raise DShieldError('Failed to retrieve top ports: {}'.format(str(e)))
 
 
 def get_daily_summary(config, params):
     """Get daily summary from DShield with improved XML handling"""
     try:
-        logger.info('Starting get_daily_summary operation with config: {}'.format({k: v for k, v in config.items() if k != 'api_key'}))
+        # Only build the redacted config copy when it will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Starting get_daily_summary operation with config: %s',
+                        {k: v for k, v in config.items() if k != 'api_key'})
         
-        dshield_obj = DShield(config)
+        dshield_obj = _get_client(config)
         # Use the working dailysummary endpoint
-        # Get data for the last 7 days
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        # Get data for the last 7 days, from one frozen timestamp so the
+        # range cannot straddle a midnight rollover
+        now = datetime.now()
+        end_date = now.strftime('%Y-%m-%d')
+        start_date = (now - timedelta(days=7)).strftime('%Y-%m-%d')
         
         # Try multiple endpoints for daily summary
         endpoints_to_try = [
@@ -269,25 +623,38 @@ def get_daily_summary(config, params):
             '/dailysummary/?json'
         ]
         
+        # Query the candidate endpoints concurrently and take the first good
+        # result, so one broken/slow endpoint does not block the others
         result = None
-        for endpoint in endpoints_to_try:
-            try:
-                logger.info('Trying endpoint: {}'.format(endpoint))
-                result = dshield_obj.make_rest_call(endpoint)
-                if result and not (isinstance(result, dict) and 'error' in result):
-                    logger.info('Successfully retrieved data from endpoint: {}'.format(endpoint))
-                    break
-                else:
-                    logger.warning('Endpoint {} returned error or empty result'.format(endpoint))
-            except Exception as e:
-                logger.warning('Endpoint {} failed: {}'.format(endpoint, str(e)))
-                continue
+        executor = ThreadPoolExecutor(max_workers=len(endpoints_to_try))
+        try:
+            futures = {
+                executor.submit(dshield_obj.make_rest_call, endpoint): endpoint
+                for endpoint in endpoints_to_try
+            }
+            for future in as_completed(futures):
+                endpoint = futures[future]
+                try:
+                    candidate = future.result()
+                    if candidate and not (isinstance(candidate, dict) and 'error' in candidate):
+                        logger.info('Successfully retrieved data from endpoint: %s', endpoint)
+                        result = candidate
+                        break
+                    else:
+                        logger.warning('Endpoint %s returned error or empty result', endpoint)
+                except Exception as e:
+                    logger.warning('Endpoint %s failed: %s', endpoint, str(e))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
         if not result:
             logger.error('All daily summary endpoints failed')
             raise DShieldError('All daily summary endpoints failed or returned no data')
-        logger.info('Received response from DShield API: {}'.format(type(result)))
-        logger.info('Response content: {}'.format(str(result)[:500] if result else 'None'))
+        logger.info('Received response from DShield API: %s', type(result))
+        # Stringifying the whole response is expensive; only do it when a
+        # debug handler will actually emit it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Response content: %s', str(result)[:500] if result else 'None')
         
         # Handle case where endpoint returns empty response
         if isinstance(result, dict) and 'error' in result and 'Empty response' in result['error']:
@@ -321,27 +688,31 @@ def get_daily_summary(config, params):
             xml_content = result['raw_response']
             
             try:
-                # Parse XML content
-                root = ET.fromstring(xml_content)
+                # Stream-parse the XML with iterparse so each <daily>
+                # element is processed and freed as it closes, instead of
+                # building the whole DOM and walking it a second time
                 daily_summaries = []
-                
-                for daily in root.findall('daily'):
-                    date = daily.find('date').text if daily.find('date') is not None else 'Unknown'
-                    records = daily.find('records').text if daily.find('records') is not None else '0'
-                    sources = daily.find('sources').text if daily.find('sources') is not None else '0'
-                    targets = daily.find('targets').text if daily.find('targets') is not None else '0'
-                    
+                total_records = total_sources = total_targets = 0
+                for event, elem in ET.iterparse(io.StringIO(xml_content), events=('end',)):
+                    if elem.tag != 'daily':
+                        continue
+
+                    records = _safe_int(elem.findtext('records'))
+                    sources = _safe_int(elem.findtext('sources'))
+                    targets = _safe_int(elem.findtext('targets'))
+
                     daily_summaries.append({
-                        'date': date,
-                        'records': int(records) if records.isdigit() else 0,
-                        'sources': int(sources) if sources.isdigit() else 0,
-                        'targets': int(targets) if targets.isdigit() else 0
+                        'date': elem.findtext('date') or 'Unknown',
+                        'records': records,
+                        'sources': sources,
+                        'targets': targets
                     })
-                
-                # Calculate totals
-                total_records = sum(d['records'] for d in daily_summaries)
-                total_sources = sum(d['sources'] for d in daily_summaries)
-                total_targets = sum(d['targets'] for d in daily_summaries)
+                    # Accumulate totals in the same pass instead of
+                    # re-walking the list once per field afterwards
+                    total_records += records
+                    total_sources += sources
+                    total_targets += targets
+                    elem.clear()
                 
                 return {
                     'daily_summaries': daily_summaries,
@@ -362,7 +733,7 @@ def get_daily_summary(config, params):
                 }
                 
             except ET.ParseError as e:
-                logger.warning('Failed to parse XML response: {}'.format(str(e)))
+                logger.warning('Failed to parse XML response: %s', str(e))
                 return {
                     'daily_summary': xml_content,
                     'summary_type': 'Raw XML (Parse Failed)',
@@ -409,24 +780,23 @@ def get_daily_summary(config, params):
         return result
         
     except DShieldError as e:
-        logger.error('DShieldError in get_daily_summary: {}'.format(str(e)))
+        logger.error('DShieldError in get_daily_summary: %s', str(e))
         raise
     except Exception as e:
-        logger.error('Unexpected error in get_daily_summary: {}'.format(str(e)))
-        logger.error('Error type: {}'.format(type(e).__name__))
-        import traceback
-        logger.error('Traceback: {}'.format(traceback.format_exc()))
+        logger.error('Unexpected error in get_daily_summary: %s', str(e))
+        logger.error('Error type: %s', type(e).__name__)
+        logger.error('Traceback: %s', traceback.format_exc())
         raise DShieldError('Failed to retrieve daily summary: {}'.format(str(e)))
 
 
 def get_top_attacking_ips(config, params):
     """Get top attacking IPs from DShield"""
     try:
-        dshield_obj = DShield(config)
-        endpoint = '/topips/?json'
+        dshield_obj = _get_client(config)
+        endpoint = _EP_TOPIPS
         logger.info('Retrieving top attacking IPs from DShield')
         
-        result = dshield_obj.make_rest_call(endpoint)
+        result = dshield_obj.make_rest_call(endpoint, no_cache=bool(params.get('no_cache')) if params else False)
         
         # Add metadata to the response
         if isinstance(result, dict):
@@ -440,13 +810,14 @@ def get_top_attacking_ips(config, params):
     except DShieldError:
         raise
     except Exception as e:
-        logger.error('Error in get_top_attacking_ips: {}'.format(str(e)))
+        logger.error('Error in get_top_attacking_ips: %s', str(e))
         raise DShieldError('Failed to retrieve top attacking IPs: {}'.format(str(e)))
 
 
 # Operations dictionary for easy access
 operations = {
     'lookup_ip': lookup_ip,
+    'lookup_ips': lookup_ips,
     'get_threat_feeds': get_threat_feeds,
     'get_top_ports': get_top_ports,
     'get_daily_summary': get_daily_summary,
@@ -1,6 +1,8 @@
+import functools
+
 from connectors.core.connector import get_logger, ConnectorError
 from .dshield_lib import (
-    operations, _check_health, DShieldError
+    operations as _raw_operations, _check_health, DShieldError
 )
 
 logger = get_logger('dshield_dev')
@@ -8,27 +10,28 @@ logger = get_logger('dshield_dev')
 
 def _convert_dshield_error_to_connector_error(func):
     """Decorator to convert DShieldError to ConnectorError for FortiSOAR compatibility"""
-    def wrapper(config, params):
+    # The exception types are bound as defaults so the except clause reads
+    # them from local slots instead of module globals on every call
+    @functools.wraps(func)
+    def wrapper(config, params, _derr=DShieldError, _cerr=ConnectorError):
         try:
             return func(config, params)
-        except DShieldError as e:
-            raise ConnectorError(str(e))
+        except _derr as e:
+            raise _cerr(str(e))
     return wrapper
 
 
-# Wrap all operations to convert DShieldError to ConnectorError
-lookup_ip = _convert_dshield_error_to_connector_error(operations['lookup_ip'])
-get_threat_feeds = _convert_dshield_error_to_connector_error(operations['get_threat_feeds'])
-get_top_ports = _convert_dshield_error_to_connector_error(operations['get_top_ports'])
-get_daily_summary = _convert_dshield_error_to_connector_error(operations['get_daily_summary'])
-get_top_attacking_ips = _convert_dshield_error_to_connector_error(operations['get_top_attacking_ips'])
-
-
-# Export operations dictionary for connector.py
+# Wrap all operations to convert DShieldError to ConnectorError; building
+# the dict from the shared library keeps the two maps from drifting apart
 operations = {
-    'lookup_ip': lookup_ip,
-    'get_threat_feeds': get_threat_feeds,
-    'get_top_ports': get_top_ports,
-    'get_daily_summary': get_daily_summary,
-    'get_top_attacking_ips': get_top_attacking_ips
+    name: _convert_dshield_error_to_connector_error(func)
+    for name, func in _raw_operations.items()
 }
+
+# Module-level aliases for backward compatibility
+lookup_ip = operations['lookup_ip']
+lookup_ips = operations['lookup_ips']
+get_threat_feeds = operations['get_threat_feeds']
+get_top_ports = operations['get_top_ports']
+get_daily_summary = operations['get_daily_summary']
+get_top_attacking_ips = operations['get_top_attacking_ips']
@@ -5,12 +5,10 @@ Replaces the playbook functionality for getting threat feeds
 """
 
 import sys
-import json
 import argparse
-from datetime import datetime
 
 # Import standalone operations
-from standalone_operations import get_threat_feeds, DShieldError
+from standalone_operations import get_threat_feeds, DShieldError, _dumps_bytes
 
 
 def main():
@@ -22,6 +20,8 @@ def main():
     parser.add_argument('--output', choices=['json', 'table'], default='json',
                        help='Output format (default: json)')
     parser.add_argument('--save-to-file', help='Save results to file')
+    parser.add_argument('--cache-ttl', type=int, default=0,
+                       help='Serve repeat requests from an on-disk cache for this many seconds (default: disabled)')
     parser.add_argument('--filter-type', help='Filter feeds by type')
     parser.add_argument('--filter-frequency', help='Filter feeds by frequency')
     
@@ -30,7 +30,8 @@ def main():
     # Configuration
     config = {
         'server_url': args.server_url,
-        'timeout': args.timeout
+        'timeout': args.timeout,
+        'cache_ttl': args.cache_ttl
     }
     
     # Parameters
@@ -49,16 +50,21 @@ def main():
             result = apply_filters(result, args.filter_type, args.filter_frequency)
         
         if args.output == 'json':
-            output = json.dumps(result, indent=2)
+            # Serialized JSON is already bytes; write it once through the
+            # stdout buffer instead of re-encoding via the text layer
+            output = _dumps_bytes(result)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.buffer.flush()
         else:
             # Table format
             output = format_threat_feeds_table(result)
-        
-        print(output)
-        
+            print(output)
+
         # Save to file if requested
         if args.save_to_file:
-            with open(args.save_to_file, 'w') as f:
+            with open(args.save_to_file, 'wb' if isinstance(output, bytes) else 'w') as f:
                 f.write(output)
             print(f"\nResults saved to: {args.save_to_file}")
         
@@ -81,21 +87,17 @@ def apply_filters(result, filter_type=None, filter_frequency=None):
     if not isinstance(feeds, list):
         return result
     
-    filtered_feeds = []
-    for feed in feeds:
-        if not isinstance(feed, dict):
-            continue
-            
-        # Apply type filter
-        if filter_type and feed.get('type', '').lower() != filter_type.lower():
-            continue
-            
-        # Apply frequency filter
-        if filter_frequency and feed.get('frequency', '').lower() != filter_frequency.lower():
-            continue
-            
-        filtered_feeds.append(feed)
-    
+    # Lowercase the filter values once instead of per feed
+    ft = filter_type.lower() if filter_type else None
+    ff = filter_frequency.lower() if filter_frequency else None
+
+    filtered_feeds = [
+        feed for feed in feeds
+        if isinstance(feed, dict)
+        and (ft is None or feed.get('type', '').lower() == ft)
+        and (ff is None or feed.get('frequency', '').lower() == ff)
+    ]
+
     result['threat_feeds'] = filtered_feeds
     result['_metadata']['total_feeds'] = len(filtered_feeds)
     
@@ -5,12 +5,10 @@ Replaces the playbook functionality for IP lookup operations
 """
 
 import sys
-import json
 import argparse
-from datetime import datetime
 
 # Import standalone operations
-from standalone_operations import lookup_ip, DShieldError
+from standalone_operations import lookup_ip, DShieldError, _dumps_bytes
 
 
 def main():
@@ -23,13 +21,16 @@ def main():
     parser.add_argument('--output', choices=['json', 'table'], default='json',
                        help='Output format (default: json)')
     parser.add_argument('--save-to-file', help='Save results to file')
+    parser.add_argument('--cache-ttl', type=int, default=0,
+                       help='Serve repeat requests from an on-disk cache for this many seconds (default: disabled)')
     
     args = parser.parse_args()
     
     # Configuration
     config = {
         'server_url': args.server_url,
-        'timeout': args.timeout
+        'timeout': args.timeout,
+        'cache_ttl': args.cache_ttl
     }
     
     # Parameters
@@ -46,16 +47,21 @@ def main():
         result = lookup_ip(config, params)
         
         if args.output == 'json':
-            output = json.dumps(result, indent=2)
+            # Serialized JSON is already bytes; write it once through the
+            # stdout buffer instead of re-encoding via the text layer
+            output = _dumps_bytes(result)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.buffer.flush()
         else:
             # Table format
             output = format_ip_result_table(result)
-        
-        print(output)
-        
+            print(output)
+
         # Save to file if requested
         if args.save_to_file:
-            with open(args.save_to_file, 'w') as f:
+            with open(args.save_to_file, 'wb' if isinstance(output, bytes) else 'w') as f:
                 f.write(output)
             print(f"\nResults saved to: {args.save_to_file}")
         
@@ -69,40 +75,57 @@ def main():
         return 1
 
 
+# (label, key) tables for each block of the lookup output, defined once at
+# module level instead of rebuilding the literals per call
+_IP_FIELDS = (
+    ('IP Address', 'number'),
+    ('Network', 'network'),
+    ('AS Number', 'as'),
+    ('AS Name', 'asname'),
+    ('AS Country', 'ascountry'),
+    ('AS Size', 'assize'),
+    ('Attack Count', 'count'),
+    ('Max Risk', 'maxrisk'),
+    ('First Seen', 'mindate'),
+    ('Last Seen', 'maxdate'),
+    ('Updated', 'updated'),
+)
+
+_ALEXA_FIELDS = (
+    ('Hostname', 'hostname'),
+    ('Last Rank', 'lastrank'),
+    ('First Seen', 'firstseen'),
+    ('Last Seen', 'lastseen'),
+    ('Domains', 'domains'),
+)
+
+_METADATA_FIELDS = (
+    ('Source', 'source'),
+    ('Connector Version', 'connector_version'),
+    ('Query IP', 'query_ip'),
+)
+
+
 def format_ip_result_table(result):
     """Format IP lookup result as a table"""
     if not isinstance(result, dict):
         return str(result)
-    
+
     lines = []
     lines.append("DShield IP Lookup Results")
     lines.append("=" * 50)
-    
+
     # Basic IP information
     if 'ip' in result:
         ip_info = result['ip']
-        lines.append(f"IP Address: {ip_info.get('number', 'N/A')}")
-        lines.append(f"Network: {ip_info.get('network', 'N/A')}")
-        lines.append(f"AS Number: {ip_info.get('as', 'N/A')}")
-        lines.append(f"AS Name: {ip_info.get('asname', 'N/A')}")
-        lines.append(f"AS Country: {ip_info.get('ascountry', 'N/A')}")
-        lines.append(f"AS Size: {ip_info.get('assize', 'N/A')}")
-        lines.append(f"Attack Count: {ip_info.get('count', 'N/A')}")
-        lines.append(f"Max Risk: {ip_info.get('maxrisk', 'N/A')}")
-        lines.append(f"First Seen: {ip_info.get('mindate', 'N/A')}")
-        lines.append(f"Last Seen: {ip_info.get('maxdate', 'N/A')}")
-        lines.append(f"Updated: {ip_info.get('updated', 'N/A')}")
-        
+        lines.extend(f"{label}: {ip_info.get(key, 'N/A')}" for label, key in _IP_FIELDS)
+
         # Alexa information
         if 'alexa' in ip_info and ip_info['alexa']:
             alexa = ip_info['alexa']
             lines.append("\nAlexa Information:")
-            lines.append(f"  Hostname: {alexa.get('hostname', 'N/A')}")
-            lines.append(f"  Last Rank: {alexa.get('lastrank', 'N/A')}")
-            lines.append(f"  First Seen: {alexa.get('firstseen', 'N/A')}")
-            lines.append(f"  Last Seen: {alexa.get('lastseen', 'N/A')}")
-            lines.append(f"  Domains: {alexa.get('domains', 'N/A')}")
-        
+            lines.extend(f"  {label}: {alexa.get(key, 'N/A')}" for label, key in _ALEXA_FIELDS)
+
         # Threat feeds
         if 'threatfeeds' in ip_info and ip_info['threatfeeds']:
             lines.append("\nThreat Feed Information:")
@@ -111,14 +134,13 @@ def format_ip_result_table(result):
                     lines.append(f"  {feed_name.title()}:")
                     lines.append(f"    First Seen: {feed_data.get('firstseen', 'N/A')}")
                     lines.append(f"    Last Seen: {feed_data.get('lastseen', 'N/A')}")
-    
+
     # Metadata
     if '_metadata' in result:
-        lines.append(f"\nMetadata:")
-        lines.append(f"  Source: {result['_metadata'].get('source', 'N/A')}")
-        lines.append(f"  Connector Version: {result['_metadata'].get('connector_version', 'N/A')}")
-        lines.append(f"  Query IP: {result['_metadata'].get('query_ip', 'N/A')}")
-    
+        metadata = result['_metadata']
+        lines.append("\nMetadata:")
+        lines.extend(f"  {label}: {metadata.get(key, 'N/A')}" for label, key in _METADATA_FIELDS)
+
     return '\n'.join(lines)
 
 
@@ -5,25 +5,28 @@ Combined script for all DShield operations
 """
 
 import sys
-import json
 import argparse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import standalone operations
 from standalone_operations import (
-    lookup_ip, get_threat_feeds, get_top_ports, 
-    get_daily_summary, get_top_attacking_ips, DShieldError
+    lookup_ip, get_threat_feeds, get_top_ports,
+    get_daily_summary, get_top_attacking_ips, operations, DShieldError, _dumps_bytes
 )
 
 
 def main():
     parser = argparse.ArgumentParser(description='DShield Operations Script')
-    parser.add_argument('operation', choices=[
-        'lookup_ip', 'get_threat_feeds', 'get_top_ports', 
-        'get_daily_summary', 'get_top_attacking_ips'
-    ], help='Operation to perform')
-    
+    parser.add_argument('operation', help=(
+        'Operation to perform, or a comma-separated list of operations to '
+        'run concurrently (choices: {})'.format(', '.join(operations))
+    ))
+
     parser.add_argument('--ip', help='IP address (for lookup_ip operation)')
+    parser.add_argument('--ips', help='Comma-separated IP addresses (for lookup_ips operation)')
+    parser.add_argument('--ip-file', help='File with one IP address per line (for lookup_ips operation)')
+    parser.add_argument('--use-http2', action='store_true',
+                       help='Multiplex bulk lookups over HTTP/2 (requires httpx[http2])')
     parser.add_argument('--server-url', default='https://www.dshield.org', 
                        help='DShield server URL (default: https://www.dshield.org)')
     parser.add_argument('--timeout', type=int, default=30, 
@@ -31,51 +34,96 @@ def main():
     parser.add_argument('--output', choices=['json', 'table'], default='json',
                        help='Output format (default: json)')
     parser.add_argument('--save-to-file', help='Save results to file')
+    parser.add_argument('--cache-ttl', type=int, default=0,
+                       help='Serve repeat requests from an on-disk cache for this many seconds (default: disabled)')
     
     args = parser.parse_args()
     
     # Configuration
     config = {
         'server_url': args.server_url,
-        'timeout': args.timeout
+        'timeout': args.timeout,
+        'cache_ttl': args.cache_ttl,
+        'use_http2': args.use_http2
     }
-    
+
     # Parameters
     params = {}
     if args.ip:
         params['ip'] = args.ip
-    
+
+    ips = []
+    if args.ips:
+        ips.extend(ip.strip() for ip in args.ips.split(',') if ip.strip())
+    if args.ip_file:
+        try:
+            with open(args.ip_file) as ip_file:
+                ips.extend(line.strip() for line in ip_file if line.strip())
+        except OSError as e:
+            print(f"Error: cannot read --ip-file: {e}", file=sys.stderr)
+            return 1
+    if ips:
+        params['ips'] = ips
+
+    selected = [name.strip() for name in args.operation.split(',') if name.strip()]
+    unknown = [name for name in selected if name not in operations]
+    if unknown:
+        print("Error: unknown operation(s): {} (choices: {})".format(
+            ', '.join(unknown), ', '.join(operations)), file=sys.stderr)
+        return 1
+
+    if 'lookup_ip' in selected and not args.ip:
+        print("Error: --ip parameter is required for lookup_ip operation", file=sys.stderr)
+        return 1
+
+    if 'lookup_ips' in selected and not ips:
+        print("Error: --ips or --ip-file is required for lookup_ips operation", file=sys.stderr)
+        return 1
+
     try:
-        print(f"Performing operation: {args.operation}")
+        print(f"Performing operation(s): {', '.join(selected)}")
         print(f"Server: {args.server_url}")
         print("-" * 50)
-        
-        # Perform the operation
-        if args.operation == 'lookup_ip':
-            if not args.ip:
-                print("Error: --ip parameter is required for lookup_ip operation", file=sys.stderr)
-                return 1
-            result = lookup_ip(config, params)
-        elif args.operation == 'get_threat_feeds':
-            result = get_threat_feeds(config, params)
-        elif args.operation == 'get_top_ports':
-            result = get_top_ports(config, params)
-        elif args.operation == 'get_daily_summary':
-            result = get_daily_summary(config, params)
-        elif args.operation == 'get_top_attacking_ips':
-            result = get_top_attacking_ips(config, params)
-        
+
+        if len(selected) == 1:
+            result = operations[selected[0]](config, params)
+        else:
+            # The operations are independent HTTP GETs, so run them
+            # concurrently and finish in roughly the slowest single call
+            result = {}
+            with ThreadPoolExecutor(max_workers=min(8, len(selected))) as executor:
+                futures = {
+                    executor.submit(operations[name], config, params): name
+                    for name in selected
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        result[name] = future.result()
+                    except DShieldError as e:
+                        result[name] = {'error': str(e)}
+
         if args.output == 'json':
-            output = json.dumps(result, indent=2)
+            # Serialized JSON is already bytes; write it once through the
+            # stdout buffer instead of re-encoding via the text layer
+            output = _dumps_bytes(result)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output)
+            sys.stdout.buffer.write(b'\n')
+            sys.stdout.buffer.flush()
         else:
             # Table format
-            output = format_result_table(args.operation, result)
-        
-        print(output)
-        
+            if len(selected) == 1:
+                output = format_result_table(selected[0], result)
+            else:
+                output = '\n\n'.join(
+                    format_result_table(name, result[name]) for name in selected
+                )
+            print(output)
+
         # Save to file if requested
         if args.save_to_file:
-            with open(args.save_to_file, 'w') as f:
+            with open(args.save_to_file, 'wb' if isinstance(output, bytes) else 'w') as f:
                 f.write(output)
             print(f"\nResults saved to: {args.save_to_file}")
         
@@ -128,17 +176,22 @@ def format_result_table(operation, result):
     return '\n'.join(lines)
 
 
+# (label, key) pairs for the IP summary block
+_IP_FIELDS = (
+    ('IP Address', 'number'),
+    ('Network', 'network'),
+    ('AS Number', 'as'),
+    ('AS Name', 'asname'),
+    ('AS Country', 'ascountry'),
+    ('Attack Count', 'count'),
+    ('Max Risk', 'maxrisk'),
+)
+
+
 def format_ip_info(ip_info):
     """Format IP information"""
-    lines = []
-    lines.append("IP Information:")
-    lines.append(f"  IP Address: {ip_info.get('number', 'N/A')}")
-    lines.append(f"  Network: {ip_info.get('network', 'N/A')}")
-    lines.append(f"  AS Number: {ip_info.get('as', 'N/A')}")
-    lines.append(f"  AS Name: {ip_info.get('asname', 'N/A')}")
-    lines.append(f"  AS Country: {ip_info.get('ascountry', 'N/A')}")
-    lines.append(f"  Attack Count: {ip_info.get('count', 'N/A')}")
-    lines.append(f"  Max Risk: {ip_info.get('maxrisk', 'N/A')}")
+    lines = ["IP Information:"]
+    lines.extend(f"  {label}: {ip_info.get(key, 'N/A')}" for label, key in _IP_FIELDS)
     return lines
 
 
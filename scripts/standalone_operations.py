@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import shared library
 from dshield_lib import (
-    operations, DShieldError, _check_health
+    operations, DShieldError, _check_health, _dumps, _dumps_bytes
 )
 
 # Configure logging
@@ -22,6 +22,7 @@ logger = logging.getLogger('dshield_dev')
 
 # Export operations for backward compatibility
 lookup_ip = operations['lookup_ip']
+lookup_ips = operations['lookup_ips']
 get_threat_feeds = operations['get_threat_feeds']
 get_top_ports = operations['get_top_ports']
 get_daily_summary = operations['get_daily_summary']